@@ -0,0 +1,93 @@
+# Copyright 2022 PyMatching Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#      http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from scipy.sparse import csr_matrix
+import pytest
+
+from pymatching import Matching
+from tests.matching.inputs import H_SMALL, WEIGHTS_SMALL, build_graph
+
+
+NONZERO_ELEMENTS_NOT_ONE_H = csr_matrix(np.array([[0, 2.01, 2.01], [1.01, 1.01, 0]]))
+TOO_MANY_CHECKS_PER_COLUMN_H = csr_matrix(np.array([[1, 1, 0, 0], [1, 0, 1, 0], [1, 0, 0, 1]]))
+
+STRING_FAULT_IDS_NX_GRAPH = build_graph("nx", ((0, 1, {"fault_ids": 'test'}),))
+NESTED_FAULT_IDS_NX_GRAPH = build_graph("nx", ((0, 1, {"fault_ids": [[1], [2]]}),))
+QUBIT_ID_AND_FAULT_IDS_NX_GRAPH = build_graph("nx", ((0, 1, {"qubit_id": 0, "fault_ids": 0}),
+                                                     (1, 2, {"qubit_id": 1, "fault_ids": 1})))
+
+QUBIT_ID_AND_FAULT_IDS_RX_GRAPH = build_graph("rx", ((0, 1, {"qubit_id": 0, "fault_ids": 0}),
+                                                     (1, 2, {"qubit_id": 1, "fault_ids": 1})))
+NON_INT_FAULT_ID_RX_GRAPH = build_graph("rx", ((0, 1, {"fault_ids": {0, "a"}}),))
+NESTED_FAULT_IDS_RX_GRAPH = build_graph("rx", ((0, 1, {"fault_ids": [[0], [2]]}),))
+
+NEGATIVE_CASES = [
+    # Check matrix
+    pytest.param(lambda: Matching(NONZERO_ELEMENTS_NOT_ONE_H), ValueError,
+                 id="nonzero_matrix_elements_not_one_raises_value_error"),
+    pytest.param(lambda: Matching(TOO_MANY_CHECKS_PER_COLUMN_H), ValueError,
+                 id="too_many_checks_per_column_raises_value_error"),
+    pytest.param(lambda: Matching("test"), TypeError,
+                 id="wrong_check_matrix_type_raises_type_error-constructor"),
+    pytest.param(lambda: Matching().load_from_check_matrix("test"), TypeError,
+                 id="wrong_check_matrix_type_raises_type_error-load_from_check_matrix"),
+    pytest.param(lambda: Matching().load_from_check_matrix(H_SMALL, spacelike_weights=WEIGHTS_SMALL,
+                                                           timelike_weights=[0.1, 0.01, 3], repetitions=3),
+                 ValueError, id="wrong_timelike_weights_raises_valueerror-wrong_length"),
+    pytest.param(lambda: Matching().load_from_check_matrix(H_SMALL, spacelike_weights=WEIGHTS_SMALL,
+                                                           timelike_weights="A", repetitions=3),
+                 ValueError, id="wrong_timelike_weights_raises_valueerror-string"),
+    pytest.param(lambda: Matching().load_from_check_matrix(H_SMALL, weights=WEIGHTS_SMALL,
+                                                           measurement_error_probabilities=[0.1, 0.01, 3],
+                                                           repetitions=3),
+                 ValueError, id="wrong_measurement_error_probabilities_raises_valueerror-wrong_length"),
+    pytest.param(lambda: Matching().load_from_check_matrix(H_SMALL, weights=WEIGHTS_SMALL,
+                                                           measurement_error_probabilities="A", repetitions=3),
+                 ValueError, id="wrong_measurement_error_probabilities_raises_valueerror-string"),
+    pytest.param(lambda: Matching().load_from_check_matrix(H_SMALL, spacelike_weights=WEIGHTS_SMALL,
+                                                           measurement_error_probabilities=[0.1, 0.1],
+                                                           repetitions=3, measurement_error_probability=[0.1, 0.1]),
+                 ValueError, id="measurement_error_probabilities_and_probability_raises_value_error"),
+    pytest.param(lambda: Matching().load_from_check_matrix(), ValueError,
+                 id="no_check_matrix_raises_value_error"),
+    pytest.param(lambda: Matching.from_check_matrix([[0, 1, 1]], faults_matrix=["A", 1]), TypeError,
+                 id="type_error_from_check_matrix"),
+    pytest.param(lambda: Matching.from_check_matrix([[0, 1, 1]], weights=[1, 1, 1], spacelike_weights=[2, 2, 2]),
+                 ValueError, id="spacelike_weights_and_weights_raises_value_error"),
+    # networkx
+    pytest.param(lambda: Matching(STRING_FAULT_IDS_NX_GRAPH), TypeError,
+                 id="bad_fault_ids_raises_type_error-string"),
+    pytest.param(lambda: Matching(NESTED_FAULT_IDS_NX_GRAPH), TypeError,
+                 id="bad_fault_ids_raises_type_error-nested_list"),
+    pytest.param(lambda: Matching().load_from_networkx("test"), TypeError,
+                 id="wrong_networkx_graph_type_raises_type_error"),
+    pytest.param(lambda: Matching().load_from_networkx(QUBIT_ID_AND_FAULT_IDS_NX_GRAPH), ValueError,
+                 id="load_from_networkx_raises_value_error_if_qubit_id_and_fault_ids_both_supplied"),
+    # retworkx
+    pytest.param(lambda: Matching().load_from_retworkx(QUBIT_ID_AND_FAULT_IDS_RX_GRAPH), ValueError,
+                 id="load_from_retworkx_raises_value_error_if_qubit_id_and_fault_ids_both_supplied"),
+    pytest.param(lambda: Matching().load_from_retworkx("A"), TypeError,
+                 id="load_from_retworkx_type_errors_raised-string"),
+    pytest.param(lambda: Matching().load_from_retworkx(NON_INT_FAULT_ID_RX_GRAPH), TypeError,
+                 id="load_from_retworkx_type_errors_raised-non_int_fault_id"),
+    pytest.param(lambda: Matching().load_from_retworkx(NESTED_FAULT_IDS_RX_GRAPH), TypeError,
+                 id="load_from_retworkx_type_errors_raised-nested_list")
+]
+
+
+@pytest.mark.parametrize("factory,exc", NEGATIVE_CASES)
+def test_rejects_bad_inputs(factory, exc):
+    with pytest.raises(exc):
+        factory()
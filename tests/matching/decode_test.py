@@ -25,9 +25,14 @@ from tests.config import DATA_DIR
 
 
 def repetition_code(n):
-    row_ind, col_ind = zip(*((i, j) for i in range(n) for j in (i, (i + 1) % n)))
+    # Column j is flipped by checks j - 1 and j, except column 0 which wraps around to check n - 1
+    indptr = np.arange(0, 2 * n + 1, 2, dtype=np.int32)
+    indices = np.empty(2 * n, dtype=np.int32)
+    indices[0::2] = np.arange(n) - 1
+    indices[1::2] = np.arange(n)
+    indices[0:2] = (0, n - 1)
     data = np.ones(2 * n, dtype=np.uint8)
-    return csc_matrix((data, (row_ind, col_ind)))
+    return csc_matrix((data, indices, indptr), shape=(n, n))
 
 
 weight_fixtures = [
@@ -13,12 +13,16 @@
 # limitations under the License.
 
 import networkx as nx
-import matplotlib.pyplot as plt
+import matplotlib
 
 from pymatching import Matching
 
+matplotlib.use("Agg")
+
 
 def test_draw_matching():
+    import matplotlib.pyplot as plt
+
     g = nx.Graph()
     g.add_edge(0, 1, fault_ids={0}, weight=1.1, error_probability=0.1)
     g.add_edge(1, 2, fault_ids={1}, weight=2.1, error_probability=0.2)
@@ -27,5 +31,8 @@ def test_draw_matching():
     g.nodes[3]['is_boundary'] = True
     g.add_edge(0, 3, weight=0.0)
     m = Matching(g)
-    plt.figure()
-    m.draw()
+    fig = plt.figure()
+    try:
+        m.draw()
+    finally:
+        plt.close(fig)
@@ -0,0 +1,42 @@
+# Copyright 2022 PyMatching Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#      http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from scipy.sparse import csc_matrix
+import networkx as nx
+import retworkx as rx
+
+
+# Shared across tests without copying: the in-place `eliminate_zeros()` in `load_from_check_matrix` is a
+# no-op since there are no explicit zeros (the buffers cannot be made read-only, as scipy rejects that)
+H_SMALL = csc_matrix(np.array([[1, 1, 0], [0, 1, 1]], dtype=np.uint8))
+WEIGHTS_SMALL = np.array([0.3, 0.7, 0.9])
+
+
+def build_graph(backend, edges_with_attrs, boundary=()):
+    if backend == "nx":
+        g = nx.Graph()
+        for u, v, attrs in edges_with_attrs:
+            g.add_edge(u, v, **attrs)
+        for b in boundary:
+            g.nodes[b]['is_boundary'] = True
+    else:
+        g = rx.PyGraph()
+        num_nodes = max(max(u, v) for u, v, _ in edges_with_attrs) + 1
+        g.add_nodes_from([{} for _ in range(num_nodes)])
+        for u, v, attrs in edges_with_attrs:
+            g.add_edge(u, v, dict(attrs))
+        for b in boundary:
+            g[b]['is_boundary'] = True
+    return g
@@ -18,6 +18,7 @@ import pytest
 
 from pymatching import Matching
 from pymatching._cpp_pymatching import sparse_column_check_matrix_to_matching_graph
+from tests.matching.inputs import H_SMALL, WEIGHTS_SMALL
 
 
 def test_boundary_from_check_matrix():
@@ -31,28 +32,6 @@ def test_boundary_from_check_matrix():
     assert np.array_equal(m.decode(np.array([0, 0, 1, 0])), np.array([0, 0, 0, 1, 1]))
 
 
-def test_nonzero_matrix_elements_not_one_raises_value_error():
-    H = csr_matrix(np.array([[0, 2.01, 2.01], [1.01, 1.01, 0]]))
-    with pytest.raises(ValueError):
-        Matching(H)
-
-
-def test_too_many_checks_per_column_raises_value_error():
-    H = csr_matrix(np.array([[1, 1, 0, 0],
-                             [1, 0, 1, 0],
-                             [1, 0, 0, 1]]))
-    with pytest.raises(ValueError):
-        Matching(H)
-
-
-def test_wrong_check_matrix_type_raises_type_error():
-    with pytest.raises(TypeError):
-        Matching("test")
-    m = Matching()
-    with pytest.raises(TypeError):
-        m.load_from_check_matrix("test")
-
-
 def test_error_probability_from_array():
     H = csr_matrix(np.array([[1, 1, 0, 0, 0], [0, 1, 1, 0, 0],
                              [0, 0, 1, 1, 0], [0, 0, 0, 1, 1]]))
@@ -109,23 +88,13 @@ def test_load_matching_from_dense_array():
                          ]
                          )
 def test_timelike_weights(t_weights, expected_edges):
-    H = np.array([[1, 1, 0], [0, 1, 1]])
     m = Matching()
-    m.load_from_check_matrix(H, spacelike_weights=np.array([0.3, 0.7, 0.9]),
+    m.load_from_check_matrix(H_SMALL, spacelike_weights=WEIGHTS_SMALL,
                              timelike_weights=t_weights, repetitions=3)
     es = set((tuple(sorted([u, v])), d["weight"]) for u, v, d in m.edges())
     assert es == expected_edges
 
 
-@pytest.mark.parametrize("t_weights", [[0.1, 0.01, 3], "A"])
-def test_wrong_timelike_weights_raises_valueerror(t_weights):
-    H = np.array([[1, 1, 0], [0, 1, 1]])
-    with pytest.raises(ValueError):
-        m = Matching()
-        m.load_from_check_matrix(H, spacelike_weights=np.array([0.3, 0.7, 0.9]),
-                                 timelike_weights=t_weights, repetitions=3)
-
-
 @pytest.mark.parametrize("p_meas,expected_edges,repetitions",
                          [
                              (
@@ -154,45 +123,19 @@ def test_wrong_timelike_weights_raises_valueerror(t_weights):
                              )
                          ]
                          )
-def test_measurement_error_probabilities(p_meas, expected_edges, repetitions):
-    m = Matching(
-        [[1, 1, 0], [0, 1, 1]],
-        error_probabilities=[0.1, 0.2, 0.3],
-        measurement_error_probabilities=p_meas,
-        repetitions=repetitions
-    )
-    es = set((tuple(sorted([u, v])), d["error_probability"]) for u, v, d in m.edges())
-    assert es == expected_edges
-
-    # Check measurement_error_probability also accepted
+@pytest.mark.parametrize("kwarg", ["measurement_error_probabilities", "measurement_error_probability"])
+def test_measurement_error_probabilities(p_meas, expected_edges, repetitions, kwarg):
+    # `measurement_error_probability` is the deprecated alias of `measurement_error_probabilities`
     m = Matching(
-        [[1, 1, 0], [0, 1, 1]],
+        H_SMALL,
         error_probabilities=[0.1, 0.2, 0.3],
-        measurement_error_probability=p_meas,
-        repetitions=repetitions
+        repetitions=repetitions,
+        **{kwarg: p_meas}
     )
     es = set((tuple(sorted([u, v])), d["error_probability"]) for u, v, d in m.edges())
     assert es == expected_edges
 
 
-@pytest.mark.parametrize("m_errors", [[0.1, 0.01, 3], "A"])
-def test_wrong_measurement_error_probabilities_raises_valueerror(m_errors):
-    H = np.array([[1, 1, 0], [0, 1, 1]])
-    with pytest.raises(ValueError):
-        m = Matching()
-        m.load_from_check_matrix(H, weights=np.array([0.3, 0.7, 0.9]),
-                                 measurement_error_probabilities=m_errors, repetitions=3)
-
-
-def test_measurement_error_probabilities_and_probability_raises_value_error():
-    H = np.array([[1, 1, 0], [0, 1, 1]])
-    with pytest.raises(ValueError):
-        m = Matching()
-        m.load_from_check_matrix(H, spacelike_weights=np.array([0.3, 0.7, 0.9]),
-                                 measurement_error_probabilities=[0.1, 0.1], repetitions=3,
-                                 measurement_error_probability=[0.1, 0.1])
-
-
 def test_cpp_csc_matrix_to_matching_graph():
     H = csc_matrix(np.array([[1, 1, 0, 0, 0, 0],
                              [0, 1, 1, 0, 0, 1],
@@ -288,24 +231,8 @@ def test_load_from_check_matrix_with_faults():
                          (1, 2, {'error_probability': -1.0, 'fault_ids': {0, 1, 2, 3}, 'weight': 1.0})]
 
 
-def test_no_check_matrix_raises_value_error():
-    with pytest.raises(ValueError):
-        m = Matching()
-        m.load_from_check_matrix()
-
-
 def test_from_empty_check_matrix():
     m = Matching.from_check_matrix([[0, 0, 0], [0, 0, 0]], faults_matrix=[[0, 0, 0], [1, 0, 1], [1, 1, 0]])
     assert m.num_fault_ids == 3
     assert m.num_edges == 0
     assert m.num_detectors == 2
-
-
-def test_type_error_from_check_matrix():
-    with pytest.raises(TypeError):
-        Matching.from_check_matrix([[0, 1, 1]], faults_matrix=["A", 1])
-
-
-def test_spacelike_weights_and_weights_raises_value_error():
-    with pytest.raises(ValueError):
-        Matching.from_check_matrix([[0, 1, 1]], weights=[1, 1, 1], spacelike_weights=[2, 2, 2])
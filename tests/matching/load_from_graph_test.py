@@ -0,0 +1,180 @@
+# Copyright 2022 PyMatching Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#      http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from pymatching import Matching
+from pymatching._cpp_pymatching import MatchingGraph
+from tests.matching.inputs import build_graph
+
+
+BOUNDARY_EDGES = (
+    (4, 0, {"fault_ids": 0}),
+    (0, 1, {"fault_ids": 1}),
+    (1, 2, {"fault_ids": 2}),
+    (2, 3, {"fault_ids": 3}),
+    (3, 4, {"fault_ids": 4})
+)
+
+BOUNDARIES_EDGES = (
+    (0, 1, {"fault_ids": 0}),
+    (1, 2, {"fault_ids": 1}),
+    (2, 3, {"fault_ids": 2}),
+    (3, 4, {"fault_ids": 3}),
+    (4, 5, {"fault_ids": 4}),
+    (0, 5, {"fault_ids": -1, "weight": 0.0})
+)
+
+UNWEIGHTED_EDGES = (
+    (0, 1, {"fault_ids": 0, "weight": 7.0}),
+    (0, 5, {"fault_ids": 1, "weight": 14.0}),
+    (0, 2, {"fault_ids": 2, "weight": 9.0}),
+    (1, 2, {"fault_ids": -1, "weight": 10.0}),
+    (1, 3, {"fault_ids": 3, "weight": 15.0}),
+    (2, 5, {"fault_ids": 4, "weight": 2.0}),
+    (2, 3, {"fault_ids": -1, "weight": 11.0}),
+    (3, 4, {"fault_ids": 5, "weight": 6.0}),
+    (4, 5, {"fault_ids": 6, "weight": 9.0})
+)
+
+FAULT_IDS_EDGES = (
+    (0, 1, {"fault_ids": 0, "weight": 1.1, "error_probability": 0.1}),
+    (1, 2, {"fault_ids": 1, "weight": 2.1, "error_probability": 0.2}),
+    (2, 3, {"fault_ids": {2, 3}, "weight": 0.9, "error_probability": 0.3}),
+    (0, 3, {"weight": 0.0})
+)
+
+QUBIT_ID_EDGES = (
+    (0, 1, {"qubit_id": 0, "weight": 1.1, "error_probability": 0.1}),
+    (1, 2, {"qubit_id": 1, "weight": 2.1, "error_probability": 0.2}),
+    (2, 3, {"qubit_id": {2, 3}, "weight": 0.9, "error_probability": 0.3}),
+    (0, 3, {"weight": 0.0})
+)
+
+# networkx yields edges grouped by node adjacency, whereas retworkx yields them in insertion order
+EXPECTED_EDGES = {
+    "nx": [
+        (0, 1, {'fault_ids': {0}, 'weight': 1.1, 'error_probability': 0.1}),
+        (0, 3, {'fault_ids': set(), 'weight': 0.0, 'error_probability': -1.0}),
+        (1, 2, {'fault_ids': {1}, 'weight': 2.1, 'error_probability': 0.2}),
+        (2, 3, {'fault_ids': {2, 3}, 'weight': 0.9, 'error_probability': 0.3})
+    ],
+    "rx": [
+        (0, 1, {'fault_ids': {0}, 'weight': 1.1, 'error_probability': 0.1}),
+        (1, 2, {'fault_ids': {1}, 'weight': 2.1, 'error_probability': 0.2}),
+        (2, 3, {'fault_ids': {2, 3}, 'weight': 0.9, 'error_probability': 0.3}),
+        (0, 3, {'fault_ids': set(), 'weight': 0.0, 'error_probability': -1.0})
+    ]
+}
+
+
+@pytest.fixture(scope="module", params=["nx", "rx"])
+def boundary_matching(request):
+    g = build_graph(request.param, BOUNDARY_EDGES, boundary={4})
+    return Matching.from_networkx(g) if request.param == "nx" else Matching(g)
+
+
+@pytest.mark.parametrize(
+    "syndrome,expected",
+    [
+        ([1, 0, 0, 0], [1, 0, 0, 0, 0]),
+        ([0, 1, 0, 0], [1, 1, 0, 0, 0]),
+        ([0, 1, 1, 0], [0, 0, 1, 0, 0]),
+        ([0, 0, 1, 0], [0, 0, 0, 1, 1])
+    ]
+)
+def test_boundary(boundary_matching, syndrome, expected):
+    m = boundary_matching
+    assert m.boundary == {4}
+    assert np.array_equal(m.decode(np.array(syndrome)), np.array(expected))
+
+
+@pytest.fixture(scope="module", params=["nx", "rx"])
+def boundaries_matching(request):
+    g = build_graph(request.param, BOUNDARIES_EDGES, boundary={0, 5})
+    return Matching.from_networkx(g) if request.param == "nx" else Matching(g)
+
+
+@pytest.mark.parametrize(
+    "syndrome,expected",
+    [
+        ([0, 1, 0, 0, 0, 0], [1, 0, 0, 0, 0]),
+        ([0, 0, 1, 0, 0], [1, 1, 0, 0, 0]),
+        ([0, 0, 1, 1, 0], [0, 0, 1, 0, 0]),
+        ([0, 0, 0, 1, 0], [0, 0, 0, 1, 1])
+    ]
+)
+def test_boundaries(boundaries_matching, syndrome, expected):
+    m = boundaries_matching
+    assert m.boundary == {0, 5}
+    assert np.array_equal(m.decode(np.array(syndrome)), np.array(expected))
+
+
+@pytest.fixture(scope="module", params=["nx", "rx"])
+def unweighted_matching(request):
+    return Matching(build_graph(request.param, UNWEIGHTED_EDGES))
+
+
+def test_unweighted_stabiliser_graph(unweighted_matching):
+    m = unweighted_matching
+    assert (m.num_fault_ids == 7)
+    assert (m.num_detectors == 6)
+    with pytest.raises(ValueError):
+        m.decode(np.array([1, 1, 0]))
+    with pytest.raises(ValueError):
+        m.decode(np.array([1, 1, 1, 0, 0, 0]))
+
+
+@pytest.mark.parametrize(
+    "syndrome,expected",
+    [
+        ([1, 0, 1, 0, 0, 0], [0, 0, 1, 0, 0, 0, 0]),
+        ([1, 0, 0, 0, 0, 1], [0, 0, 1, 0, 1, 0, 0]),
+        ([0, 1, 0, 0, 0, 1], [0, 0, 0, 0, 1, 0, 0])
+    ]
+)
+def test_unweighted_stabiliser_graph_decode(unweighted_matching, syndrome, expected):
+    m = unweighted_matching
+    assert np.array_equal(m.decode(np.array(syndrome)), np.array(expected))
+
+
+@pytest.mark.parametrize("backend", ["nx", "rx"])
+def test_mwpm(backend):
+    m = Matching(build_graph(backend, ((0, 1, {"fault_ids": 0}), (0, 2, {"fault_ids": 1}), (1, 2, {"fault_ids": 2}))))
+    assert (isinstance(m._matching_graph, MatchingGraph))
+    assert (m.num_detectors == 3)
+    assert (m.num_fault_ids == 3)
+
+    m = Matching(build_graph(backend, ((0, 1, {}), (0, 2, {}), (1, 2, {}))))
+    assert (isinstance(m._matching_graph, MatchingGraph))
+    assert (m.num_detectors == 3)
+    assert (m.num_fault_ids == 0)
+
+    m = Matching(build_graph(backend, ((0, 1, {"weight": 1.5}), (0, 2, {"weight": 1.7}), (1, 2, {"weight": 1.2}))))
+    assert (isinstance(m._matching_graph, MatchingGraph))
+    assert (m.num_detectors == 3)
+    assert (m.num_fault_ids == 0)
+
+
+@pytest.mark.parametrize("backend", ["nx", "rx"])
+def test_matching_edges(backend):
+    m = Matching(build_graph(backend, FAULT_IDS_EDGES, boundary={0, 3}))
+    assert list(m.edges()) == EXPECTED_EDGES[backend]
+
+
+@pytest.mark.parametrize("backend", ["nx", "rx"])
+def test_qubit_id_accepted(backend):
+    m = Matching(build_graph(backend, QUBIT_ID_EDGES, boundary={0, 3}))
+    assert list(m.edges()) == EXPECTED_EDGES[backend]
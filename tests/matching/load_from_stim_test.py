@@ -20,26 +20,40 @@ from pymatching.matching import Matching
 from tests.config import DATA_DIR
 
 
-def test_load_from_stim_objects():
+@pytest.fixture(scope="session")
+def surface_circuit():
     stim = pytest.importorskip("stim")
-    c = stim.Circuit.generated("surface_code:rotated_memory_x", distance=5, rounds=5,
-                               after_clifford_depolarization=0.01,
-                               before_measure_flip_probability=0.01,
-                               after_reset_flip_probability=0.01,
-                               before_round_data_depolarization=0.01)
-    dem = c.detector_error_model(decompose_errors=True)
-    m = Matching.from_detector_error_model(dem)
-    assert m.num_detectors == dem.num_detectors
-    assert m.num_fault_ids == dem.num_observables
+    return stim.Circuit.generated("surface_code:rotated_memory_x", distance=5, rounds=5,
+                                  after_clifford_depolarization=0.01,
+                                  before_measure_flip_probability=0.01,
+                                  after_reset_flip_probability=0.01,
+                                  before_round_data_depolarization=0.01)
+
+
+@pytest.fixture(scope="session")
+def surface_dem(surface_circuit):
+    return surface_circuit.detector_error_model(decompose_errors=True)
+
+
+def test_load_from_dem_via_loader(surface_dem):
+    m = Matching.from_detector_error_model(surface_dem)
+    assert m.num_detectors == surface_dem.num_detectors
+    assert m.num_fault_ids == surface_dem.num_observables
+    assert m.num_edges == 502
+
+
+def test_load_from_dem_via_ctor(surface_dem):
+    m = Matching(surface_dem)
+    assert m.num_detectors == surface_dem.num_detectors
+    assert m.num_fault_ids == surface_dem.num_observables
+    assert m.num_edges == 502
+
+
+def test_load_from_stim_circuit(surface_circuit, surface_dem):
+    m = Matching.from_stim_circuit(surface_circuit)
+    assert m.num_detectors == surface_dem.num_detectors
+    assert m.num_fault_ids == surface_dem.num_observables
     assert m.num_edges == 502
-    m2 = Matching(dem)
-    assert m2.num_detectors == dem.num_detectors
-    assert m2.num_fault_ids == dem.num_observables
-    assert m2.num_edges == 502
-    m3 = Matching.from_stim_circuit(c)
-    assert m3.num_detectors == dem.num_detectors
-    assert m3.num_fault_ids == dem.num_observables
-    assert m3.num_edges == 502
 
 
 def test_load_from_stim_files():